@@ -1,7 +1,19 @@
+import json
 from argparse import ArgumentParser
 from pathlib import Path
 from kicad import KicadParser
-from neoden import Feeders, Writer
+from neoden import (
+    Feeders,
+    Writer,
+    Reader,
+    Regenerator,
+    Transform,
+    MountProfile,
+    MachineProfile,
+    Sequencer,
+    Rework,
+    Preflight,
+)
 
 
 def main():
@@ -12,17 +24,15 @@ def main():
         "--pos",
         "-p",
         type=Path,
-        required=True,
-        help="Input file path (KiCad csv position file)",
-        default=Path("examples/example-top-pos.csv"),
+        required=False,
+        help="Input file path (KiCad csv position file), required unless --rework is used",
     )
     parser.add_argument(
         "--bom",
         "-b",
         type=Path,
-        required=True,
-        help="Input file path (KiCad BOM file)",
-        default=Path("examples/example-top-bom.csv"),
+        required=False,
+        help="Input file path (KiCad BOM file), required unless --rework is used",
     )
     parser.add_argument(
         "--out",
@@ -32,22 +42,165 @@ def main():
         help="Output file path (Neoden YY1 format file)",
         default=Path("output.csv"),
     )
+    parser.add_argument(
+        "--previous",
+        type=Path,
+        required=False,
+        help="Previously generated Neoden YY1 file; machine edits for unchanged parts are kept",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only validate the input files and print a JSON report; exits 1 on errors",
+    )
+    parser.add_argument(
+        "--rework",
+        metavar="REFS",
+        help='Designators or ranges to place again, e.g. "R10-R45,C3"; uses the --previous job',
+    )
+    parser.add_argument(
+        "--rework-mode",
+        choices=["only", "skip"],
+        default="only",
+        help="Write only the reworked rows (only) or every row with Skip set on the rest (skip)",
+    )
+    parser.add_argument(
+        "--machine",
+        type=Path,
+        required=False,
+        help="Machine profile (JSON) with feeder slot positions, head offsets and axis speeds",
+    )
+    parser.add_argument(
+        "--origin",
+        type=float,
+        nargs=2,
+        metavar=("X", "Y"),
+        help="Board origin in KiCad coordinates; positions are shifted so it becomes (0, 0)",
+    )
+    parser.add_argument(
+        "--mirror-bottom",
+        type=float,
+        metavar="WIDTH",
+        help="Mirror bottom-side placements about the given board width (mm)",
+    )
+    parser.add_argument(
+        "--rotation-offsets",
+        type=Path,
+        help="CSV file with Package and Offset columns for tape orientation corrections",
+    )
+    parser.add_argument(
+        "--ignore-conflicts",
+        action="store_true",
+        help="Report overlapping or duplicate placements as warnings instead of failing",
+    )
     args = parser.parse_args()
+    if args.check:
+        check(args)
+        return
     # check if arg is required
+    output_file = validate_file(args.out, is_input=False, is_required=True)
+    previous = None
+    if args.previous:
+        previous = Reader(validate_file(args.previous, is_input=True, is_required=True))
+    if args.machine:
+        machine = MachineProfile(read_machine(args.machine))
+    else:
+        machine = MachineProfile()
+    if args.rework:
+        if not previous:
+            print("Error: --rework needs the original job passed with --previous.")
+            exit(1)
+        rework = Rework(previous, Sequencer(machine))
+        try:
+            refs = rework.resolve(args.rework)
+        except ValueError as e:
+            print(f"Error: {e}")
+            exit(1)
+        writer = Writer(
+            components=rework.build(refs, only=args.rework_mode == "only"),
+            output=output_file,
+            header_rows=previous.header_rows,
+        )
+        writer.create_file()
+        return
+    if not args.pos or not args.bom:
+        print("Error: --pos and --bom are required unless --rework is used.")
+        exit(1)
     pos_file = validate_file(args.pos, is_input=True, is_required=True)
     bom_file = validate_file(args.bom, is_input=True, is_required=False)
-    output_file = validate_file(args.out, is_input=False, is_required=True)
     kicadParser = KicadParser(pos_file=pos_file, bom_file=bom_file)
     components = kicadParser.components
-    feeders = Feeders()
+    if kicadParser.conflicts:
+        level = "Warning" if args.ignore_conflicts else "Error"
+        for conflict in kicadParser.conflicts:
+            print(f"{level}: {conflict}")
+        if not args.ignore_conflicts:
+            exit(1)
+    if args.origin or args.mirror_bottom is not None or args.rotation_offsets:
+        rotation_offsets = None
+        if args.rotation_offsets:
+            offsets_file = validate_file(
+                args.rotation_offsets, is_input=True, is_required=True
+            )
+            rotation_offsets = Transform.load_rotation_offsets(offsets_file)
+        transform = Transform(
+            origin=tuple(args.origin or (0.0, 0.0)),
+            mirror_width=args.mirror_bottom,
+            rotation_offsets=rotation_offsets,
+        )
+        transform.apply(components)
+    header_rows = None
+    planned = components
+    if previous:
+        regenerator = Regenerator(previous)
+        planned = regenerator.merge(components)
+        header_rows = previous.header_rows
+        print(
+            f"Kept {len(regenerator.kept)} ({len(regenerator.moved)} moved), "
+            f"re-planned {len(regenerator.changed)}, "
+            f"removed {len(regenerator.removed)} placements from {args.previous}"
+        )
+    feeders = Feeders(machine)
     feeders.set_feeders(components)
-    sorted_components = sorted(
-        components, key=lambda c: (getattr(c, "feederNo", 0), str(c.ref))
+    MountProfile().apply(planned)
+    sorted_components = Sequencer(machine).sequence(list(components))
+    writer = Writer(
+        components=sorted_components, output=output_file, header_rows=header_rows
     )
-    writer = Writer(components=sorted_components, output=output_file)
     writer.create_file()
 
 
+def check(args):
+    if not args.pos:
+        print("Error: --check needs at least --pos.")
+        exit(1)
+    pos_file = validate_file(args.pos, is_input=True, is_required=True)
+    bom_file = (
+        validate_file(args.bom, is_input=True, is_required=True) if args.bom else None
+    )
+    if args.machine:
+        slots = read_machine(args.machine)["slots"]
+    else:
+        slots = MachineProfile.default_data()["slots"]
+    preflight = Preflight(pos_file, bom_file, [s["width"] for s in slots])
+    preflight.run()
+    report = preflight.report()
+    print(json.dumps(report, indent=2))
+    if not report["ok"]:
+        exit(1)
+
+
+def read_machine(file_path: Path) -> dict:
+    if not file_path.is_file():
+        print(f"Error: {file_path} is not a valid file.")
+        exit(1)
+    try:
+        return MachineProfile.read(file_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        exit(1)
+
+
 def validate_file(file_path: Path, is_input: bool, is_required: bool):
     if not file_path.exists() and is_input and is_required:
         print(f"Error: {file_path} does not exist.")
@@ -1,4 +1,13 @@
 from .component import KicadComponent, ComponentInfo
+from .value import normalize_value
+from .validation import Conflict, PlacementValidator
 from .parser import KicadParser
 
-__all__ = ["KicadComponent", "ComponentInfo", "KicadParser"]
+__all__ = [
+    "KicadComponent",
+    "ComponentInfo",
+    "Conflict",
+    "PlacementValidator",
+    "KicadParser",
+    "normalize_value",
+]
@@ -16,6 +16,10 @@ class ComponentInfo:
             Returns a sorted list of all unique component types across all packages.
         list_components_by_type(component_type: str) -> dict[str, float]:
             Returns a dictionary mapping package names to heights for a given component type.
+        get_type(ref: str) -> str | None:
+            Returns the component type for a reference designator like "R12" or "FB3". Returns None if unknown.
+        get_size(descriptor: str) -> tuple[float, float] | None:
+            Returns the approximate courtyard (x, y) in mm at rotation 0 for a package or descriptor. Returns None if unknown.
     """
 
     def __init__(self):
@@ -116,6 +120,53 @@ class ComponentInfo:
             "CPG1316S01D02": "cpg1316s01d02",  # specific hotswap socket
         }
 
+        # Approximate courtyard sizes (x, y) in mm, body plus IPC-7351 nominal clearance,
+        # in KiCad's rotation-0 footprint orientation (e.g. SOIC pad rows run along X)
+        self.sizes = {
+            # Chip packages
+            "0201": (1.10, 0.60),
+            "0402": (1.50, 0.90),
+            "0603": (2.30, 1.20),
+            "0805": (2.80, 1.70),
+            "1206": (4.00, 2.10),
+            "1210": (4.00, 3.00),
+            "1812": (5.40, 3.80),
+            "2010": (5.90, 3.10),
+            "2512": (7.20, 3.80),
+            "0808": (2.60, 2.60),
+            # Diode packages
+            "SOD-523": (2.10, 1.10),
+            "SOD-323": (3.00, 1.70),
+            "SOD-123": (4.30, 2.10),
+            "SMA": (6.00, 3.10),
+            "SMB": (6.00, 4.10),
+            "SMC": (8.60, 6.60),
+            # Transistors & small signal
+            "SOT-23": (3.40, 3.00),
+            "SOT-323": (2.70, 2.80),
+            "SOT-523": (2.10, 2.10),
+            "SOT-223": (7.80, 7.40),
+            "TO-220": (10.50, 4.90),
+            # IC packages
+            "SOIC-8": (7.40, 5.40),
+            "SOIC-14": (7.40, 9.00),
+            "TSSOP-8": (7.00, 3.50),
+            "TSSOP-14": (7.00, 5.50),
+            "QFN-16": (4.00, 4.00),
+            "QFN-32": (6.00, 6.00),
+            "DFN-6": (3.00, 3.00),
+            "DFN-8": (3.50, 3.50),
+            "QFP-64": (18.00, 18.00),
+            "LQFP-64": (12.50, 12.50),
+            # Power packages
+            "DPAK": (10.50, 7.00),
+            "D2PAK": (15.80, 10.80),
+            # Hotswap socket
+            "KHS": (16.00, 7.00),
+            "HS": (16.00, 7.00),
+            "MIKEHOLSCHER": (15.00, 15.00),
+        }
+
     def get_height(
         self, *, descriptor: str = None, component_type: str = None, package: str = None
     ) -> float | None:
@@ -211,6 +262,37 @@ class ComponentInfo:
             return None
         return parts[1].upper()
 
+    def get_type(self, ref: str) -> str | None:
+        """
+        Get the component type from a reference designator.
+
+        Args:
+            ref (str): A reference designator like "R12" or "FB3".
+
+        Returns:
+            str | None: The component type if the prefix is known, otherwise None.
+        """
+        prefix = ref.rstrip("0123456789").upper()
+        return self.prefix_map.get(prefix)
+
+    def get_size(self, descriptor: str) -> tuple[float, float] | None:
+        """
+        Get the approximate courtyard size for a package.
+
+        Args:
+            descriptor (str): A package name like "0603" or a descriptor like "R_0603_1608Metric"
+                or "LQFP-64_10x10mm_P0.5mm".
+
+        Returns:
+            tuple[float, float] | None: (x, y) extent in millimeters at rotation 0 if found, otherwise None.
+        """
+        parts = descriptor.upper().split("_")
+        # Ex: R_0603_1608Metric carries the package second, LQFP-64_10x10mm first
+        for candidate in (parts[1:2] + parts[:1]):
+            if candidate in self.sizes:
+                return self.sizes[candidate]
+        return None
+
 
 class KicadComponent:
     """
@@ -225,6 +307,12 @@ class KicadComponent:
         rot (float): Rotation angle of the component in degrees.
         side (str): Side of the board where the component is placed ('top' or 'bottom').
         height (float): Height of the component in mm.
+        feederNo (int): Feeder number the component is picked from.
+        head (int): Head number used to place the component.
+        mount_speed (int): Mount speed in percent.
+        pick_height (float): Pick height offset in mm.
+        mode (int): Neoden placement mode.
+        skip (int): 1 if the machine should skip the placement, otherwise 0.
     """
 
     def __init__(
@@ -239,6 +327,10 @@ class KicadComponent:
         height: float = None,
         feederNo: int = 0,
         head: int = 0,
+        mount_speed: int = 100,
+        pick_height: float = 0,
+        mode: int = 1,
+        skip: int = 0,
     ):
 
         self.ref = ref
@@ -251,6 +343,10 @@ class KicadComponent:
         self.height = height
         self.feederNo = feederNo
         self.head = head
+        self.mount_speed = mount_speed
+        self.pick_height = pick_height
+        self.mode = mode
+        self.skip = skip
         # If height is provided, set it; otherwise, calculate it using ComponentInfo first by descriptor and then by package and type
         if height is None:
             heights = ComponentInfo()
@@ -263,7 +359,8 @@ class KicadComponent:
     def __repr__(self):
         return (
             f"KicadComponent(ref={self.ref}, val={self.val}, package={self.package}, "
-            f"pos_x={self.pos_x}, pos_y={self.pos_y}, rot={self.rot}, side={self.side}, height={self.height}, feederNo={self.feederNo}, head={self.head})"
+            f"pos_x={self.pos_x}, pos_y={self.pos_y}, rot={self.rot}, side={self.side}, height={self.height}, feederNo={self.feederNo}, head={self.head}, "
+            f"mount_speed={self.mount_speed}, pick_height={self.pick_height}, mode={self.mode}, skip={self.skip})"
         )
 
     def set_feeder(self, feederNo: int):
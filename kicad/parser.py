@@ -1,6 +1,6 @@
 import csv
 from pathlib import Path
-from kicad import KicadComponent
+from kicad import KicadComponent, PlacementValidator
 
 
 class KicadParser:
@@ -11,22 +11,29 @@ class KicadParser:
         self.pos_file = pos_file
         self.bom_file = bom_file
         self.components = set[KicadComponent]()
+        self.conflicts = []
         self.parse()
 
+    IGNORE_WORDS = {
+        "Fiducial",
+        "SwitchHoles",
+        "TestPoint",
+        "TestPad",
+        "TestPadSMD",
+        "SwitchHole",
+        "MouseBite",
+    }
+
+    @classmethod
+    def ignored(cls, val: str, package: str) -> bool:
+        # not placed by the machine, e.g. fiducials and test points
+        return any(word in val for word in cls.IGNORE_WORDS) or any(
+            word in package for word in cls.IGNORE_WORDS
+        )
+
     def valid_component(self, component: KicadComponent) -> bool:
         # check for val and package if its not part of ignore list
-        ignore_words = {
-            "Fiducial",
-            "SwitchHoles",
-            "TestPoint",
-            "TestPad",
-            "TestPadSMD",
-            "SwitchHole",
-            "MouseBite",
-        }
-        if any(word in component.val for word in ignore_words) or any(
-            word in component.package for word in ignore_words
-        ):
+        if self.ignored(component.val, component.package):
             return False
 
         return True
@@ -143,6 +150,12 @@ class KicadParser:
         # for comp in pos_comp:
         #     print(comp)
         self.components = self.__combine_components(pos_comp, bom_comp)
+        self.validate()
+
+    def validate(self):
+        # check for overlapping or duplicate placements before anything is written
+        self.conflicts = PlacementValidator(self.components).find_conflicts()
+        return self.conflicts
 
 
 if __name__ == "__main__":
@@ -151,3 +164,5 @@ if __name__ == "__main__":
     parser = KicadParser(pos_file=pos_path, bom_file=bos_path)
     for comp in parser.components:
         print(comp)
+    for conflict in parser.conflicts:
+        print(conflict)
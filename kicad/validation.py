@@ -0,0 +1,122 @@
+import math
+import statistics
+from dataclasses import dataclass
+from kicad import KicadComponent, ComponentInfo
+
+
+@dataclass
+class Conflict:
+    kind: str  # "duplicate" or "overlap"
+    first: str
+    second: str
+    side: str
+
+    def __str__(self):
+        if self.kind == "duplicate":
+            return f"{self.first} and {self.second} share the same coordinates on {self.side} side"
+        return f"{self.first} and {self.second} courtyards overlap on {self.side} side"
+
+
+class PlacementValidator:
+    """
+    Detects placements that overlap or sit at identical coordinates.
+
+    Components are bucketed into a uniform grid whose cell size is the median
+    courtyard extent on the board. Each component is entered into every cell its
+    courtyard covers, so two overlapping courtyards always share a cell. Only those
+    candidates are compared, which keeps the check near linear instead of comparing
+    every pair, even when a few large footprints sit among small passives.
+
+    Attributes:
+        components (set[KicadComponent]): Components to validate.
+        info (ComponentInfo): Package catalog used for approximate courtyard sizes.
+    """
+
+    def __init__(self, components: set[KicadComponent], info: ComponentInfo = None):
+        self.components = components
+        self.info = info or ComponentInfo()
+
+    def extent(self, component: KicadComponent) -> tuple[float, float]:
+        """
+        Get the axis-aligned courtyard extent of a component after rotation.
+
+        Args:
+            component (KicadComponent): The component to measure.
+
+        Returns:
+            tuple[float, float]: (width, height) in mm, (0, 0) if the package size is unknown.
+        """
+        size = self.info.get_size(component.package or "")
+        if size is None:
+            return 0.0, 0.0
+        size_x, size_y = size
+        angle = math.radians(component.rot or 0.0)
+        cos, sin = abs(math.cos(angle)), abs(math.sin(angle))
+        return (
+            round(size_x * cos + size_y * sin, 4),
+            round(size_x * sin + size_y * cos, 4),
+        )
+
+    def find_conflicts(self) -> list[Conflict]:
+        """
+        Find duplicate coordinates and overlapping courtyards on each board side.
+
+        Returns:
+            list[Conflict]: Conflicts sorted by designator pair.
+        """
+        placed = [
+            (c, *self.extent(c))
+            for c in self.components
+            if c.pos_x is not None and c.pos_y is not None
+        ]
+        if not placed:
+            return []
+        # size cells for the typical part so one large footprint does not make every
+        # cell crowded; large parts are entered into each cell their courtyard covers
+        cell = max(1.0, statistics.median(max(w, h) for _, w, h in placed))
+        grid: dict[tuple[str, int, int], list[tuple[KicadComponent, float, float]]] = {}
+        conflicts = []
+        # Sort by ref so each pair is reported once in a stable order
+        for entry in sorted(placed, key=lambda e: e[0].ref):
+            c, w, h = entry
+            cells = [
+                (c.side, cx, cy)
+                for cx in range(
+                    math.floor((c.pos_x - w / 2) / cell),
+                    math.floor((c.pos_x + w / 2) / cell) + 1,
+                )
+                for cy in range(
+                    math.floor((c.pos_y - h / 2) / cell),
+                    math.floor((c.pos_y + h / 2) / cell) + 1,
+                )
+            ]
+            seen = set()
+            for key in cells:
+                for other, ow, oh in grid.get(key, ()):
+                    if other.ref in seen:
+                        continue
+                    seen.add(other.ref)
+                    conflict = self.__compare(c, w, h, other, ow, oh)
+                    if conflict:
+                        conflicts.append(conflict)
+            for key in cells:
+                grid.setdefault(key, []).append(entry)
+        return sorted(conflicts, key=lambda k: (k.first, k.second))
+
+    def __compare(
+        self,
+        a: KicadComponent,
+        aw: float,
+        ah: float,
+        b: KicadComponent,
+        bw: float,
+        bh: float,
+    ) -> Conflict | None:
+        first, second = sorted((a.ref, b.ref))
+        if a.pos_x == b.pos_x and a.pos_y == b.pos_y:
+            return Conflict("duplicate", first, second, a.side)
+        if abs(a.pos_x - b.pos_x) < (aw + bw) / 2 and abs(a.pos_y - b.pos_y) < (
+            ah + bh
+        ) / 2:
+            return Conflict("overlap", first, second, a.side)
+        return None
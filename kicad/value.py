@@ -0,0 +1,106 @@
+import re
+from functools import lru_cache
+
+# SI prefixes as written on schematics; "M" is mega and "m" is milli
+MULTIPLIERS = {
+    "": 1.0,
+    "p": 1e-12,
+    "P": 1e-12,
+    "n": 1e-9,
+    "N": 1e-9,
+    "u": 1e-6,
+    "U": 1e-6,
+    "µ": 1e-6,
+    "μ": 1e-6,
+    "m": 1e-3,
+    "k": 1e3,
+    "K": 1e3,
+    "M": 1e6,
+    "meg": 1e6,
+    "G": 1e9,
+}
+
+# value of the "R"/"E" decimal marker in RKM codes, e.g. 4R7 is 4.7 ohm, 4.7 pF or 4.7 uH
+RKM_UNIT = {"resistor": 1.0, "capacitor": 1e-12, "inductor": 1e-6}
+
+VALUE = re.compile(
+    r"^(?P<num>\d+(?:\.\d*)?|\.\d+)"
+    r"(?P<mult>(?i:meg)|[pPnNuUµμmkKMG])?"
+    r"(?i:ohms?|Ω|r|f|h)?$"
+)
+RKM = re.compile(
+    r"^(?P<int>\d*)(?P<mult>[RrEpnuµμkKMG])(?P<frac>\d+)(?i:ohms?|Ω|f|h)?$"
+)
+# tokens that rate the part rather than give its value: tolerance, voltage, dielectric
+RATING = re.compile(
+    r"^(?:±?(?P<tolerance>\d+(?:\.\d+)?)%"
+    r"|(?P<voltage>\d+(?:\.\d+)?)[vV](?:[dD][cC])?"
+    r"|(?P<dielectric>(?i:X[5-8][RSTPV]|Y5V|C0G|NP0)))$"
+)
+# order of the ratings in the grouping key
+RATINGS = ("voltage", "dielectric", "tolerance")
+SEPARATORS = re.compile(r"[\s/,;_]+")
+# "10 kOhm" is one value, "100n 16V" is two tokens
+DETACHED_UNIT = re.compile(r"(?<=\d)\s+(?=[^\d\s±])")
+
+
+@lru_cache(maxsize=None)
+def normalize_value(value: str, component_type: str | None) -> str:
+    """
+    Normalize a resistor, capacitor or inductor value so equal parts share one key.
+
+    "10k", "10K", "10kΩ" and "10000" all become "resistor:10000"; "100nF" and "0.1uF"
+    both become "capacitor:1e-07". Voltage, dielectric and tolerance ratings are kept in
+    the key, so "100nF 50V X7R" becomes "capacitor:1e-07|50V|X7R" and does not share a
+    feeder with a 16V part. Other component types and values that cannot be parsed are
+    returned unchanged.
+
+    Args:
+        value (str): The value as written in KiCad.
+        component_type (str | None): The component type, e.g. "resistor".
+
+    Returns:
+        str: The grouping key for the value.
+    """
+    if component_type not in RKM_UNIT or not value:
+        return value
+    number = None
+    ratings = dict[str, str]()
+    for token in SEPARATORS.split(DETACHED_UNIT.sub("", value.strip())):
+        if not token:
+            continue
+        rating = RATING.match(token)
+        if rating:
+            kind = rating.lastgroup
+            ratings.setdefault(kind, _rating(kind, rating[kind]))
+        elif number is None:
+            number = _parse(token, component_type)
+    if number is None:
+        return value
+    key = f"{component_type}:{number:.6g}"
+    return "|".join([key] + [ratings[kind] for kind in RATINGS if kind in ratings])
+
+
+def _rating(kind: str, text: str) -> str:
+    if kind == "voltage":
+        return f"{float(text):g}V"
+    if kind == "tolerance":
+        return f"{float(text):g}%"
+    # NP0 is the older name of the same C0G dielectric
+    text = text.upper()
+    return "C0G" if text == "NP0" else text
+
+
+def _parse(token: str, component_type: str) -> float | None:
+    match = VALUE.match(token)
+    if match:
+        mult = match["mult"] or ""
+        if mult.lower() == "meg":
+            mult = "meg"
+        return float(match["num"]) * MULTIPLIERS[mult]
+    match = RKM.match(token)
+    if match and (match["int"] or match["mult"] in "Rr"):
+        mult = match["mult"]
+        scale = RKM_UNIT[component_type] if mult in "RrE" else MULTIPLIERS[mult]
+        return float(f"{match['int'] or 0}.{match['frac']}") * scale
+    return None
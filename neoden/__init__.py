@@ -1,5 +1,27 @@
 # from .writer import NeodenWriter
+from .machine import MachineProfile, Slot
 from .feeder import Feeders
 from .writer import Writer
+from .reader import Placement, Reader
+from .profile import MountProfile
+from .regenerate import Regenerator
+from .sequence import Sequencer
+from .rework import Rework
+from .check import Issue, Preflight
+from .transform import Transform
 
-__all__ = ["Feeders", "Writer"]
+__all__ = [
+    "MachineProfile",
+    "Slot",
+    "Feeders",
+    "Writer",
+    "Placement",
+    "Reader",
+    "MountProfile",
+    "Regenerator",
+    "Sequencer",
+    "Rework",
+    "Issue",
+    "Preflight",
+    "Transform",
+]
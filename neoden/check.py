@@ -0,0 +1,229 @@
+import csv
+from collections import Counter
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from kicad import KicadParser, ComponentInfo, normalize_value
+from neoden.feeder import Feeders
+
+
+@dataclass
+class Issue:
+    level: str  # "error" or "warning"
+    code: str
+    message: str
+    file: str
+    line: int | None = None
+    ref: str | None = None
+
+
+class Preflight:
+    """
+    Validates KiCad position and BOM files for conversion without building components.
+
+    Each file is streamed once and every problem is collected instead of stopping at the
+    first one: missing headers, empty or invalid fields, duplicate designators, position/BOM
+    mismatches, unknown packages and component groups that no feeder can take.
+
+    Attributes:
+        pos_file (Path): KiCad position file.
+        bom_file (Path | None): KiCad BOM file.
+        slot_widths (list[int]): Tape width of every feeder slot on the machine.
+        issues (list[Issue]): Problems found by run().
+    """
+
+    def __init__(
+        self, pos_file: Path, bom_file: Path | None, slot_widths: list[int]
+    ):
+        self.pos_file = pos_file
+        self.bom_file = bom_file
+        self.slot_widths = slot_widths
+        self.info = ComponentInfo()
+        self.issues = list[Issue]()
+        self.placements = 0
+
+    def error(
+        self, code: str, message: str, file: Path, line: int = None, ref: str = None
+    ):
+        self.issues.append(Issue("error", code, message, str(file), line, ref))
+
+    def warning(
+        self, code: str, message: str, file: Path, line: int = None, ref: str = None
+    ):
+        self.issues.append(Issue("warning", code, message, str(file), line, ref))
+
+    def __has_headers(self, file: Path, headers: set[str]) -> bool:
+        # reports missing headers once so the caller can skip the file's checks
+        with file.open("r", encoding="utf-8") as f:
+            found = set(csv.DictReader(f).fieldnames or [])
+        if not headers.issubset(found):
+            self.error(
+                "missing_headers",
+                f"Missing required headers: {sorted(headers - found)}",
+                file,
+                line=1,
+            )
+            return False
+        return True
+
+    def __rows(self, file: Path):
+        # yields (line number, row)
+        with file.open("r", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+
+    def __check_pos(self) -> dict[str, tuple[str, str]] | None:
+        # None when the headers are missing, so the cross-check is skipped
+        if not self.__has_headers(self.pos_file, KicadParser.REQUIRED_HEADERS_POS):
+            return None
+        refs = dict[str, tuple[str, str]]()
+        for line, row in self.__rows(self.pos_file):
+            ref = (row["Ref"] or "").strip()
+            val = (row["Val"] or "").strip()
+            package = (row["Package"] or "").strip()
+            if not ref or not val or not package:
+                self.error(
+                    "empty_field",
+                    "Ref, Val, or Package is empty",
+                    self.pos_file,
+                    line,
+                    ref or None,
+                )
+                continue
+            if KicadParser.ignored(val, package):
+                continue
+            if (row["Side"] or "").strip().lower() not in {"top", "bottom"}:
+                self.error(
+                    "invalid_side",
+                    f"Invalid side '{row['Side']}'",
+                    self.pos_file,
+                    line,
+                    ref,
+                )
+            for column in ("PosX", "PosY", "Rot"):
+                try:
+                    float(row[column])
+                except (TypeError, ValueError):
+                    self.error(
+                        "invalid_number",
+                        f"Invalid {column} '{row[column]}'",
+                        self.pos_file,
+                        line,
+                        ref,
+                    )
+            if ref in refs:
+                self.error(
+                    "duplicate_ref",
+                    f"Duplicate Ref '{ref}'",
+                    self.pos_file,
+                    line,
+                    ref,
+                )
+                continue
+            refs[ref] = (val, package)
+        return refs
+
+    def __check_bom(self) -> set[str] | None:
+        # None when the headers are missing, so the cross-check is skipped
+        if not self.__has_headers(self.bom_file, KicadParser.REQUIRED_HEADERS_BOM):
+            return None
+        refs = set[str]()
+        for line, row in self.__rows(self.bom_file):
+            val = (row["Value"] or "").strip()
+            package = (row["package"] or "").strip()
+            if KicadParser.ignored(val, package):
+                continue
+            for ref in (row["Reference"] or "").split(","):
+                ref = ref.strip()
+                if not ref:
+                    self.error(
+                        "empty_field",
+                        "Reference list has an empty entry",
+                        self.bom_file,
+                        line,
+                    )
+                elif ref in refs:
+                    self.error(
+                        "duplicate_ref",
+                        f"Duplicate Reference '{ref}'",
+                        self.bom_file,
+                        line,
+                        ref,
+                    )
+                else:
+                    refs.add(ref)
+        return refs
+
+    def __check_packages(self, refs: dict[str, tuple[str, str]]):
+        groups = dict[tuple[str, str], list[str]]()
+        unknown = dict[str, list[str]]()
+        for ref, (val, package) in refs.items():
+            name = self.info.get_package(package)
+            known = (
+                name in self.info.data
+                or package.split("_")[0].upper() in self.info.data
+            )
+            if not known:
+                unknown.setdefault(package, []).append(ref)
+            key = (name or package, normalize_value(val, self.info.get_type(ref)))
+            groups.setdefault(key, []).append(ref)
+        for package, members in unknown.items():
+            self.warning(
+                "unknown_package",
+                f"Unknown package '{package}' used by {members}",
+                self.pos_file,
+            )
+        free = Counter(self.slot_widths)
+        # same order as Feeders.set_feeders: biggest groups claim slots first
+        for (package, val), members in sorted(
+            groups.items(), key=lambda g: -len(g[1])
+        ):
+            width = Feeders.get_width_by_package(package)
+            if width is None:
+                self.warning(
+                    "no_feeder",
+                    f"No feeder width known for {package} {val} {members}",
+                    self.pos_file,
+                )
+            elif free[width] == 0:
+                self.warning(
+                    "no_feeder",
+                    f"No free {width} mm feeder for {package} {val} {members}",
+                    self.pos_file,
+                )
+            else:
+                free[width] -= 1
+
+    def run(self) -> list[Issue]:
+        self.issues = []
+        pos_refs = self.__check_pos()
+        self.placements = len(pos_refs or {})
+        bom_refs = self.__check_bom() if self.bom_file else None
+        # a file with missing headers has no refs to compare, not an empty board
+        if pos_refs is not None and bom_refs is not None:
+            for ref in sorted(pos_refs.keys() - bom_refs):
+                self.error(
+                    "missing_in_bom",
+                    f"'{ref}' is in the position file but not in the BOM",
+                    self.bom_file,
+                    ref=ref,
+                )
+            for ref in sorted(bom_refs - pos_refs.keys()):
+                self.error(
+                    "missing_in_pos",
+                    f"'{ref}' is in the BOM but not in the position file",
+                    self.pos_file,
+                    ref=ref,
+                )
+        if pos_refs is not None:
+            self.__check_packages(pos_refs)
+        return self.issues
+
+    def report(self) -> dict:
+        return {
+            "ok": not any(i.level == "error" for i in self.issues),
+            "placements": self.placements,
+            "errors": sum(i.level == "error" for i in self.issues),
+            "warnings": sum(i.level == "warning" for i in self.issues),
+            "issues": [asdict(i) for i in self.issues],
+        }
@@ -1,5 +1,7 @@
+from collections import Counter
 from dataclasses import dataclass
-from kicad import KicadComponent, ComponentInfo
+from kicad import KicadComponent, ComponentInfo, normalize_value
+from neoden.machine import MachineProfile
 
 
 @dataclass
@@ -11,22 +13,27 @@ class Feeder:
 
 
 class Feeders:
-    def __init__(self):
-        self.feeders = [
-            *(Feeder(i, width=8) for i in range(1, 18)),
-            *(Feeder(i, width=12) for i in range(18, 22)),
-            *(Feeder(i, width=16) for i in range(22, 23)),
-            *(Feeder(i, width=8) for i in range(23, 44)),
-            *(Feeder(i, width=16) for i in range(44, 46)),
-            *(Feeder(i, width=12) for i in range(46, 48)),
-            *(Feeder(i, width=8) for i in range(48, 51)),
-        ]
-
-    def get_feeder_by_width(self, width: int):
-        # return feederNo for available feeders with the specified width
-        for f in self.feeders:
-            if f.width == width and f.available:
-                return f.feederNo
+    def __init__(self, machine: MachineProfile | None = None):
+        self.machine = machine or MachineProfile()
+        self.feeders = [Feeder(s.feederNo, width=s.width) for s in self.machine.slots]
+
+    def get_feeder_by_width(
+        self, width: int, components: list[KicadComponent] | None = None
+    ):
+        # return feederNo for available feeders with the specified width,
+        # the one with the least travel to the given components if any
+        candidates = [f for f in self.feeders if f.width == width and f.available]
+        if not candidates:
+            return None
+        if not components:
+            return candidates[0].feederNo
+        return min(
+            candidates,
+            key=lambda f: sum(
+                self.machine.travel_cost(f.feederNo, c.pos_x or 0, c.pos_y or 0)
+                for c in components
+            ),
+        ).feederNo
 
     def get_available_feeders(self):
         return [feeder for feeder in self.feeders if feeder.available]
@@ -43,7 +50,8 @@ class Feeders:
                 return feeder
         return None
 
-    def get_width_by_package(self, package: str):
+    @staticmethod
+    def get_width_by_package(package: str):
         data = [
             {
                 "packages": [
@@ -81,6 +89,13 @@ class Feeders:
         else:
             raise ValueError(f"Feeder {feeder_no} not found.")
 
+    def reserve_feeder(self, feeder_no: int, refs: list[str]):
+        # keep a feeder that was assigned outside of set_feeders, e.g. on the machine
+        feeder = self.get_feeder_by_no(feeder_no)
+        if feeder:
+            self.add_refs_to_feeder(feeder_no, refs)
+            feeder.available = False
+
     def show_feeders(self):
         for feeder in self.feeders:
             print(feeder)
@@ -88,36 +103,58 @@ class Feeders:
     def set_feeders(self, components: set[KicadComponent]):
         info = ComponentInfo()
         groups = []
-        # Group components by (package, value)
+        # Group components by (package, normalized value) so "10k" and "10000" share a feeder
         for component in components:
             package = info.get_package(component.package)
             if not package:
                 package = component.package
+            value = normalize_value(component.val, info.get_type(component.ref))
             # Check if this group already exists
             exists = any(
-                group["package"] == package and group["value"] == component.val
+                group["package"] == package and group["value"] == value
                 for group in groups
             )
             if not exists:
                 groups.append(
                     {
                         "package": package,
-                        "value": component.val,
+                        "value": value,
                         "refs": [component.ref],
                         "components": [component],  # Track components in this group
                     }
                 )
             else:
                 for group in groups:
-                    if group["package"] == package and group["value"] == component.val:
+                    if group["package"] == package and group["value"] == value:
                         group["refs"].append(component.ref)
                         group["components"].append(component)
                         break
 
-        # Assign each group to a feeder and set feeder_no on each component
+        # Keep feeders that are already assigned and let the rest of their group join them
         for group in groups:
+            assigned = [c for c in group["components"] if c.feederNo]
+            if not assigned:
+                continue
+            counts = Counter(c.feederNo for c in assigned)
+            for feeder_no in sorted(counts):
+                self.reserve_feeder(
+                    feeder_no,
+                    sorted(c.ref for c in assigned if c.feederNo == feeder_no),
+                )
+            # the feeder most kept members use, lowest number on a tie
+            shared = min(counts, key=lambda f: (-counts[f], f))
+            for comp in group["components"]:
+                if not comp.feederNo:
+                    comp.set_feeder(shared)
+                    self.reserve_feeder(shared, [comp.ref])
+            group["assigned"] = True
+
+        # Assign each remaining group to a feeder, biggest groups get the closest slots
+        for group in sorted(groups, key=lambda g: -len(g["refs"])):
+            if group.get("assigned"):
+                continue
             width = self.get_width_by_package(group["package"])
-            feeder_no = self.get_feeder_by_width(width)
+            feeder_no = self.get_feeder_by_width(width, group["components"])
             if feeder_no is not None:
                 self.add_refs_to_feeder(feeder_no, group["refs"])
                 self.toggle_feeder_availability(feeder_no)  # Mark as used
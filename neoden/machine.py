@@ -0,0 +1,217 @@
+import hashlib
+import json
+import math
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass
+class Slot:
+    feederNo: int
+    width: int
+    x: float
+    y: float
+
+
+class MachineProfile:
+    """
+    Physical layout of the pick-and-place machine and a precomputed travel-cost matrix.
+
+    The board area is divided into a grid; for every feeder slot the travel time (seconds)
+    from the slot's pick position to the centre of each grid cell is computed once and kept
+    in a flat array, so feeder assignment and sequencing only do index lookups. The matrix
+    is cached on disk keyed by a hash of the profile and reused on the next run.
+
+    Attributes:
+        slots (list[Slot]): Feeder slots with width (mm) and pick position in machine coordinates (mm).
+        head_offsets (dict[int, tuple[float, float]]): Nozzle offset of each head from head 1 (mm).
+        nozzle_stations (list[tuple[float, float]]): Nozzle change station positions (mm).
+        axis_speeds (tuple[float, float]): X and Y axis speeds (mm/s).
+        board_origin (tuple[float, float]): Machine coordinates of the board origin (mm).
+        board_size (tuple[float, float]): Width and height of the board area covered by the grid (mm).
+        grid (float): Grid cell size (mm).
+    """
+
+    # (first feederNo, last feederNo, tape width) on the stock YY1, front row then back row
+    DEFAULT_LAYOUT = [
+        (1, 17, 8),
+        (18, 21, 12),
+        (22, 22, 16),
+        (23, 43, 8),
+        (44, 45, 16),
+        (46, 47, 12),
+        (48, 50, 8),
+    ]
+
+    def __init__(self, data: dict | None = None, cache_dir: Path | None = None):
+        self.data = data or self.default_data()
+        self.slots = [
+            Slot(s["feederNo"], s["width"], s["x"], s["y"]) for s in self.data["slots"]
+        ]
+        self.head_offsets = {
+            int(head): tuple(offset)
+            for head, offset in self.data.get("head_offsets", {}).items()
+        }
+        self.nozzle_stations = [tuple(s) for s in self.data.get("nozzle_stations", [])]
+        self.axis_speeds = tuple(self.data["axis_speeds"])
+        self.board_origin = tuple(self.data["board"]["origin"])
+        self.board_size = tuple(self.data["board"]["size"])
+        self.grid = float(self.data["board"]["grid"])
+        self.columns = math.ceil(self.board_size[0] / self.grid)
+        self.rows = math.ceil(self.board_size[1] / self.grid)
+        self.slot_index = {s.feederNo: i for i, s in enumerate(self.slots)}
+        self.cache_dir = cache_dir or Path.home() / ".cache" / "kicad_to_neoden"
+        self.travel = self.__load_travel()
+
+    @classmethod
+    def read(cls, path: Path) -> dict:
+        # parse and validate a profile file without building the travel matrix
+        with path.open("r", encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Machine profile {path} is not valid JSON: {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError(f"Machine profile {path} must be a JSON object.")
+        missing = {"slots", "axis_speeds", "board"} - set(data)
+        if missing:
+            raise ValueError(f"Machine profile {path} missing required keys: {missing}")
+        for slot in data["slots"]:
+            missing = {"feederNo", "width", "x", "y"} - set(slot)
+            if missing:
+                raise ValueError(
+                    f"Machine profile {path} slot {slot} missing required keys: {missing}"
+                )
+        if not cls.__numbers(data["axis_speeds"], positive=True):
+            raise ValueError(
+                f"Machine profile {path} axis_speeds must be two positive numbers."
+            )
+        board = data["board"]
+        if not isinstance(board, dict):
+            raise ValueError(f"Machine profile {path} board must be a JSON object.")
+        missing = {"origin", "size", "grid"} - set(board)
+        if missing:
+            raise ValueError(f"Machine profile {path} board missing required keys: {missing}")
+        if not cls.__numbers(board["origin"]):
+            raise ValueError(f"Machine profile {path} board origin must be two numbers.")
+        if not cls.__numbers(board["size"], positive=True):
+            raise ValueError(
+                f"Machine profile {path} board size must be two positive numbers."
+            )
+        if not cls.__numbers([board["grid"]], count=1, positive=True):
+            raise ValueError(f"Machine profile {path} board grid must be a positive number.")
+        return data
+
+    @staticmethod
+    def __numbers(values, count: int = 2, positive: bool = False) -> bool:
+        # bool is an int subclass, but true/false in a profile is a mistake
+        return (
+            isinstance(values, list)
+            and len(values) == count
+            and all(
+                isinstance(v, (int, float))
+                and not isinstance(v, bool)
+                and (not positive or v > 0)
+                for v in values
+            )
+        )
+
+    @classmethod
+    def load(cls, path: Path, cache_dir: Path | None = None) -> "MachineProfile":
+        return cls(cls.read(path), cache_dir=cache_dir)
+
+    @classmethod
+    def default_data(cls) -> dict:
+        # Approximate stock YY1 geometry: slots are tape width plus 2 mm apart on two rows
+        slots = []
+        x = 10.0
+        for first, last, width in cls.DEFAULT_LAYOUT:
+            for feeder_no in range(first, last + 1):
+                if feeder_no == 23:
+                    x = 10.0
+                y = 0.0 if feeder_no < 23 else 330.0
+                slots.append(
+                    {"feederNo": feeder_no, "width": width, "x": x + width / 2, "y": y}
+                )
+                x += width + 2
+        return {
+            "slots": slots,
+            "head_offsets": {"1": [0.0, 0.0], "2": [-41.0, 0.0]},
+            "nozzle_stations": [[300.0, 20.0], [310.0, 20.0], [320.0, 20.0]],
+            "axis_speeds": [500.0, 500.0],
+            "board": {"origin": [60.0, 60.0], "size": [250.0, 250.0], "grid": 5.0},
+        }
+
+    def save(self, path: Path):
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2)
+
+    def __cache_file(self) -> Path:
+        key = hashlib.sha1(json.dumps(self.data, sort_keys=True).encode()).hexdigest()
+        return self.cache_dir / f"travel-{key[:16]}.bin"
+
+    def __load_travel(self) -> array:
+        size = len(self.slots) * self.columns * self.rows
+        cache_file = self.__cache_file()
+        travel = array("d")
+        try:
+            with cache_file.open("rb") as f:
+                travel.fromfile(f, size)
+            return travel
+        except (OSError, EOFError):
+            pass
+        travel = self.__compute_travel()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with cache_file.open("wb") as f:
+                travel.tofile(f)
+        except OSError:
+            pass  # an unwritable cache only costs the recomputation next time
+        return travel
+
+    def __compute_travel(self) -> array:
+        vx, vy = self.axis_speeds
+        ox, oy = self.board_origin
+        centres_x = [ox + (i + 0.5) * self.grid for i in range(self.columns)]
+        centres_y = [oy + (j + 0.5) * self.grid for j in range(self.rows)]
+        travel = array("d")
+        for slot in self.slots:
+            # both axes move at once, so the slower axis sets the time
+            tx = [abs(cx - slot.x) / vx for cx in centres_x]
+            for cy in centres_y:
+                ty = abs(cy - slot.y) / vy
+                travel.extend(t if t > ty else ty for t in tx)
+        return travel
+
+    def cell(self, x: float, y: float) -> int:
+        """
+        Get the grid cell index for board coordinates, clamped to the board area.
+
+        Args:
+            x (float): X position on the board (mm).
+            y (float): Y position on the board (mm).
+
+        Returns:
+            int: The cell index.
+        """
+        column = min(max(int(x // self.grid), 0), self.columns - 1)
+        row = min(max(int(y // self.grid), 0), self.rows - 1)
+        return row * self.columns + column
+
+    def travel_cost(self, feeder_no: int, x: float, y: float) -> float | None:
+        """
+        Get the travel time from a feeder slot to a board position.
+
+        Args:
+            feeder_no (int): The feeder number.
+            x (float): X position on the board (mm).
+            y (float): Y position on the board (mm).
+
+        Returns:
+            float | None: Travel time in seconds, or None if the feeder is not in the profile.
+        """
+        index = self.slot_index.get(feeder_no)
+        if index is None:
+            return None
+        return self.travel[index * self.columns * self.rows + self.cell(x, y)]
@@ -0,0 +1,160 @@
+from kicad import KicadComponent
+
+
+class MountProfile:
+    """
+    Chooses mount speed and pick height for each placement from its package family and height.
+
+    Every family has a speed cap and a nominal carrier tape pocket depth; the component height
+    then picks a speed class, and the placement gets the slower of the two. Low chip parts run
+    at full speed while tall, heavy or fine-pitch parts are slowed down to keep them on the
+    nozzle. The pick height is how far the top of the part sits below the tape surface, i.e.
+    pocket depth minus component height, so thin parts in deep pockets are not missed.
+
+    Attributes:
+        families (dict): Maps family names to package prefixes, speed cap (%) and pocket depth (mm).
+        speed_classes (list[tuple[float, int]]): (max height in mm, speed %) pairs, lowest first.
+        unknown_speed (int): Speed cap for packages outside every family.
+    """
+
+    def __init__(self):
+        self.families = {
+            "chip": {
+                "packages": [
+                    "0201",
+                    "0402",
+                    "0603",
+                    "0805",
+                    "1206",
+                    "1210",
+                    "1812",
+                    "2010",
+                    "2512",
+                    "0808",
+                ],
+                "speed": 100,
+                "pocket_depth": 0.8,
+            },
+            "diode": {
+                "packages": ["SOD-", "SMA", "SMB", "SMC"],
+                "speed": 100,
+                "pocket_depth": 1.3,
+            },
+            "sot": {"packages": ["SOT-"], "speed": 90, "pocket_depth": 1.4},
+            "ic": {"packages": ["SOIC-", "SO-"], "speed": 80, "pocket_depth": 2.1},
+            "fine_pitch": {
+                "packages": ["TSSOP-", "MSOP-", "QFN-", "DFN-", "QFP-", "LQFP-"],
+                "speed": 60,
+                "pocket_depth": 1.5,
+            },
+            "power": {
+                "packages": ["DPAK", "D2PAK", "TO-"],
+                "speed": 50,
+                "pocket_depth": 2.7,
+            },
+            "socket": {
+                "packages": ["KHS", "HS", "MIKEHOLSCHER"],
+                "speed": 50,
+                "pocket_depth": 2.5,
+            },
+        }
+        self.speed_classes = [(1.0, 100), (2.0, 80), (3.0, 60), (float("inf"), 40)]
+        self.unknown_speed = 50
+        self.__family_cache = dict[str, str | None]()
+
+    def get_family(self, package: str) -> str | None:
+        """
+        Get the package family for a footprint.
+
+        Args:
+            package (str): A package or descriptor like "R_0603_1608Metric" or "SOT-23".
+
+        Returns:
+            str | None: The family name if found, otherwise None.
+        """
+        if package in self.__family_cache:
+            return self.__family_cache[package]
+        parts = package.upper().split("_")
+        family = None
+        # Ex: R_0603_1608Metric carries the package second, SOT-23 / LQFP-64_10x10mm first
+        for candidate in parts[1:2] + parts[:1]:
+            family = next(
+                (
+                    name
+                    for name, entry in self.families.items()
+                    if any(
+                        candidate == p or (p.endswith("-") and candidate.startswith(p))
+                        for p in entry["packages"]
+                    )
+                ),
+                None,
+            )
+            if family:
+                break
+        self.__family_cache[package] = family
+        return family
+
+    def get_height(self, height) -> float | None:
+        """
+        Get the component height in mm from a KiCad or BOM value.
+
+        Args:
+            height: A number or a BOM string like "1.6" or "1.6mm".
+
+        Returns:
+            float | None: The height in mm, or None if it is missing or cannot be read.
+        """
+        if height is None or isinstance(height, (int, float)):
+            return height
+        text = str(height).strip().lower().removesuffix("mm").strip()
+        try:
+            return float(text)
+        except ValueError:
+            return None
+
+    def get_speed(self, family: str | None, height: float | None) -> int:
+        """
+        Get the fastest safe mount speed for a family and component height.
+
+        Args:
+            family (str | None): The package family.
+            height (float | None): The component height in mm.
+
+        Returns:
+            int: Mount speed in percent.
+        """
+        cap = self.families[family]["speed"] if family else self.unknown_speed
+        if height is None:
+            return cap
+        speed = next(s for limit, s in self.speed_classes if height <= limit)
+        return min(speed, cap)
+
+    def get_pick_height(self, family: str | None, height: float | None) -> float:
+        """
+        Get the pick height offset for a family and component height.
+
+        Args:
+            family (str | None): The package family.
+            height (float | None): The component height in mm.
+
+        Returns:
+            float: Pick height in mm, 0 if the part is flush with or above the tape surface
+                or if family or height is unknown.
+        """
+        if not family or height is None:
+            return 0.0
+        return round(max(0.0, self.families[family]["pocket_depth"] - height), 2)
+
+    def apply(self, components: list[KicadComponent]):
+        """
+        Set mount speed and pick height on each component.
+
+        Args:
+            components (list[KicadComponent]): Components to profile.
+        """
+        for c in components:
+            family = self.get_family(c.package or "")
+            # an unreadable BOM height is treated as unknown and gets the family cap
+            height = self.get_height(c.height)
+            c.mount_speed = self.get_speed(family, height)
+            c.pick_height = self.get_pick_height(family, height)
@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+from pathlib import Path
+from kicad import KicadComponent
+import csv
+
+
+@dataclass
+class Placement:
+    ref: str
+    val: str
+    package: str
+    pos_x: float
+    pos_y: float
+    rot: float
+    head: int
+    feederNo: int
+    mount_speed: int
+    pick_height: float
+    place_height: float | None
+    mode: int
+    skip: int
+
+    def to_component(self) -> KicadComponent:
+        return KicadComponent(
+            ref=self.ref,
+            val=self.val,
+            package=self.package,
+            pos_x=self.pos_x,
+            pos_y=self.pos_y,
+            rot=self.rot,
+            height=self.place_height,
+            feederNo=self.feederNo,
+            head=self.head,
+            mount_speed=self.mount_speed,
+            pick_height=self.pick_height,
+            mode=self.mode,
+            skip=self.skip,
+        )
+
+
+class Reader:
+    """
+    Reads a Neoden YY1 pick-and-place file.
+
+    Attributes:
+        input (Path): Path to the YY1 csv file.
+        header_rows (list[list[str]]): Rows above the placement table (panel, fiducials,
+            offsets and nozzle changes), kept verbatim so they can be written back.
+        placements (dict[str, Placement]): Placements keyed by designator.
+    """
+
+    # column name in the file (stripped) -> Placement field and type;
+    # "height" columns are optional and may carry a unit, e.g. "" or "1.6mm"
+    COLUMNS = {
+        "Designator": ("ref", str),
+        "Comment": ("val", str),
+        "Footprint": ("package", str),
+        "Mid X(mm)": ("pos_x", float),
+        "Mid Y(mm)": ("pos_y", float),
+        "Rotation": ("rot", float),
+        "Head": ("head", int),
+        "FeederNo": ("feederNo", int),
+        "Mount Speed(%)": ("mount_speed", int),
+        "Pick Height(mm)": ("pick_height", float),
+        "Place Height(mm)": ("place_height", "height"),
+        "Mode": ("mode", int),
+        "Skip": ("skip", int),
+    }
+
+    def __init__(self, input: Path):
+        self.input = input
+        self.header_rows = list[list[str]]()
+        self.placements = dict[str, Placement]()
+        self.parse()
+
+    def parse(self):
+        with self.input.open("r", encoding="utf-8") as f:
+            rows = csv.reader(f)
+            for row in rows:
+                if row and row[0].strip() == "Designator":
+                    columns = [name.strip() for name in row]
+                    break
+                self.header_rows.append(row)
+            else:
+                raise ValueError(f"No placement table found in {self.input}.")
+            missing = set(self.COLUMNS) - set(columns)
+            if missing:
+                raise ValueError(
+                    f"Input file missing required headers. Required: {set(self.COLUMNS)}, missing: {missing}"
+                )
+            for row in rows:
+                if not row or not row[0].strip():
+                    continue
+                placement = self.__parse_row(dict(zip(columns, row)))
+                if placement.ref in self.placements:
+                    raise ValueError(f"Duplicate Designator '{placement.ref}' found in the file.")
+                self.placements[placement.ref] = placement
+
+    @staticmethod
+    def parse_height(value: str) -> float | None:
+        # Writer copies KiCad/BOM heights as given, so they can be empty or "1.6mm"
+        text = value.strip().lower().removesuffix("mm").strip()
+        try:
+            return float(text)
+        except ValueError:
+            return None
+
+    def __parse_row(self, row: dict[str, str]) -> Placement:
+        values = {}
+        for column, (field, cast) in self.COLUMNS.items():
+            value = row.get(column, "").strip()
+            if cast == "height":
+                values[field] = self.parse_height(value)
+                continue
+            try:
+                # int columns may have been saved as "1.0" by a spreadsheet
+                values[field] = cast(float(value)) if cast is int else cast(value)
+            except ValueError as e:
+                raise ValueError(f"Invalid value for '{column}' in row: {row}") from e
+        return Placement(**values)
+
+
+if __name__ == "__main__":
+    reader = Reader(Path("examples/example-neoden.csv"))
+    for row in reader.header_rows:
+        print(row)
+    for placement in reader.placements.values():
+        print(placement)
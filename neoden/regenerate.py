@@ -0,0 +1,76 @@
+from kicad import KicadComponent
+from neoden.reader import Reader, Placement
+
+
+class Regenerator:
+    """
+    Carries machine-side edits from a previous YY1 file over to freshly parsed components.
+
+    Previous placements are joined to the new components by designator through the
+    reader's ref index. Feeder, head, speed, heights, mode and skip belong to the part,
+    not to where it sits, so a component whose value and footprint are unchanged keeps
+    the settings chosen on the machine even if it moved or rotated; only its coordinates
+    and rotation are refreshed from KiCad. New parts and parts with a changed value or
+    footprint are left for normal feeder planning.
+
+    Attributes:
+        previous (Reader): The previously generated YY1 file.
+        tolerance (float): Maximum coordinate/rotation difference still treated as not moved.
+        kept (list[KicadComponent]): Components that took over the previous machine settings.
+        moved (list[str]): Designators of kept components whose position or rotation changed.
+        changed (list[KicadComponent]): New or modified components that need planning.
+        removed (list[str]): Designators present in the previous file but no longer on the board.
+    """
+
+    def __init__(self, previous: Reader, tolerance: float = 0.005):
+        self.previous = previous
+        self.tolerance = tolerance
+        self.kept = list[KicadComponent]()
+        self.moved = list[str]()
+        self.changed = list[KicadComponent]()
+        self.removed = list[str]()
+
+    def same_part(self, component: KicadComponent, placement: Placement) -> bool:
+        return (
+            component.val == placement.val and component.package == placement.package
+        )
+
+    def moved_part(self, component: KicadComponent, placement: Placement) -> bool:
+        return (
+            abs(component.pos_x - placement.pos_x) > self.tolerance
+            or abs(component.pos_y - placement.pos_y) > self.tolerance
+            or abs(component.rot - placement.rot) > self.tolerance
+        )
+
+    def merge(self, components: set[KicadComponent]) -> list[KicadComponent]:
+        """
+        Apply previous machine settings to components whose value and footprint are unchanged.
+
+        Args:
+            components (set[KicadComponent]): Components parsed from the KiCad files.
+
+        Returns:
+            list[KicadComponent]: The components that still need feeder planning.
+        """
+        placements = self.previous.placements
+        seen = set()
+        for component in components:
+            seen.add(component.ref)
+            placement = placements.get(component.ref)
+            if placement is None or not self.same_part(component, placement):
+                self.changed.append(component)
+                continue
+            if self.moved_part(component, placement):
+                self.moved.append(component.ref)
+            component.set_feeder(placement.feederNo)
+            component.head = placement.head
+            component.mount_speed = placement.mount_speed
+            component.pick_height = placement.pick_height
+            if placement.place_height is not None:
+                component.height = placement.place_height
+            component.mode = placement.mode
+            component.skip = placement.skip
+            self.kept.append(component)
+        self.moved.sort()
+        self.removed = sorted(ref for ref in placements if ref not in seen)
+        return self.changed
@@ -0,0 +1,112 @@
+import re
+from bisect import bisect_left, bisect_right
+from kicad import KicadComponent
+from neoden.reader import Reader
+from neoden.sequence import Sequencer
+
+REF = re.compile(r"^(?P<prefix>[A-Za-z_]+)(?P<number>\d+)$")
+
+
+class Rework:
+    """
+    Builds a rework job for a subset of designators from an original YY1 file.
+
+    The original job's feeder, head, speed and height settings are reused unchanged, so the
+    machine setup stays as it is. Designators are resolved through an index of prefix to
+    sorted designator numbers, which lets ranges like "R10-R45" be answered with a binary
+    search instead of scanning every placement. Designators and ranges are matched without
+    regard to case.
+
+    Attributes:
+        original (Reader): The original YY1 job.
+        sequencer (Sequencer): Orders the reworked placements.
+        index (dict[str, tuple[list[int], list[str]]]): Prefix mapped to sorted numbers and their designators.
+        refs (dict[str, str]): Upper-cased designator mapped to the designator in the file.
+    """
+
+    def __init__(self, original: Reader, sequencer: Sequencer):
+        self.original = original
+        self.sequencer = sequencer
+        self.index = self.__build_index()
+        self.refs = {ref.upper(): ref for ref in reversed(original.placements)}
+
+    def __build_index(self) -> dict[str, tuple[list[int], list[str]]]:
+        grouped = dict[str, list[tuple[int, str]]]()
+        for ref in self.original.placements:
+            match = REF.match(ref)
+            if match:
+                grouped.setdefault(match["prefix"].upper(), []).append(
+                    (int(match["number"]), ref)
+                )
+        index = {}
+        for prefix, entries in grouped.items():
+            entries.sort()
+            index[prefix] = ([n for n, _ in entries], [r for _, r in entries])
+        return index
+
+    def resolve(self, spec: str) -> list[str]:
+        """
+        Resolve a list of designators and ranges against the original job.
+
+        Args:
+            spec (str): Comma or space separated designators and ranges, e.g. "R10-R45, C3 U1".
+
+        Returns:
+            list[str]: Matching designators in the order they were requested, without duplicates.
+        """
+        refs = dict[str, None]()
+        unknown = []
+        for item in re.split(r"[\s,;]+", spec.strip()):
+            if not item:
+                continue
+            first, _, last = item.partition("-")
+            if not last:
+                ref = self.refs.get(item.upper())
+                if ref:
+                    refs[ref] = None
+                else:
+                    unknown.append(item)
+                continue
+            start, end = REF.match(first), REF.match(last)
+            if not start or not end or start["prefix"].upper() != end["prefix"].upper():
+                raise ValueError(f"Invalid designator range '{item}'.")
+            if int(start["number"]) > int(end["number"]):
+                raise ValueError(f"Designator range '{item}' runs backwards.")
+            numbers, names = self.index.get(start["prefix"].upper(), ([], []))
+            lo = bisect_left(numbers, int(start["number"]))
+            hi = bisect_right(numbers, int(end["number"]))
+            if lo >= hi:
+                unknown.append(item)
+            refs.update(dict.fromkeys(names[lo:hi]))
+        if unknown:
+            raise ValueError(f"Designators not found in {self.original.input}: {unknown}")
+        return list(refs)
+
+    def build(self, refs: list[str], only: bool = True) -> list[KicadComponent]:
+        """
+        Build the placements for the rework job.
+
+        Args:
+            refs (list[str]): Designators to place again.
+            only (bool): Write only the reworked rows if True, otherwise keep every row and
+                set Skip on the ones that are not reworked.
+
+        Returns:
+            list[KicadComponent]: Reworked placements in Sequencer order (speed class, then
+                feeder and travel), followed by the skipped rows in original file order.
+        """
+        wanted = set(refs)
+        rework = [self.original.placements[ref].to_component() for ref in refs]
+        for c in rework:
+            c.skip = 0
+        rework = self.sequencer.sequence(rework)
+        if only:
+            return rework
+        skipped = [
+            p.to_component()
+            for ref, p in self.original.placements.items()
+            if ref not in wanted
+        ]
+        for c in skipped:
+            c.skip = 1
+        return rework + skipped
@@ -0,0 +1,31 @@
+from kicad import KicadComponent
+from neoden.machine import MachineProfile
+
+
+class Sequencer:
+    """
+    Orders placements for the machine using the profile's travel-cost matrix.
+
+    Placements are batched by speed class, fastest first, so low parts are placed before
+    tall ones. Within a class they are grouped by feeder in feeder order, and within a
+    feeder the ones closest to the slot go first. Placements without a known feeder keep
+    designator order.
+
+    Attributes:
+        machine (MachineProfile): Machine profile providing travel costs.
+    """
+
+    def __init__(self, machine: MachineProfile):
+        self.machine = machine
+
+    def sequence(self, components: list[KicadComponent]) -> list[KicadComponent]:
+        def key(c: KicadComponent):
+            cost = self.machine.travel_cost(c.feederNo, c.pos_x or 0, c.pos_y or 0)
+            return (
+                -c.mount_speed,
+                c.feederNo,
+                cost if cost is not None else 0.0,
+                str(c.ref),
+            )
+
+        return sorted(components, key=key)
@@ -0,0 +1,127 @@
+import csv
+import re
+from fnmatch import translate
+from pathlib import Path
+from kicad import KicadComponent, ComponentInfo
+
+
+class Transform:
+    """
+    Converts KiCad board coordinates into machine coordinates for a whole job at once.
+
+    Each side gets one 2x3 affine matrix that combines the board-origin shift and, for
+    the bottom side, the mirror about the board width. Rotation corrections for tape
+    orientation come from a per-package table that is compiled into a single regular
+    expression and resolved once per distinct footprint.
+
+    Attributes:
+        origin (tuple[float, float]): Board origin in KiCad coordinates, moved to (0, 0).
+        mirror_width (float | None): Board width in mm; when set, bottom-side placements
+            are mirrored about it so they match the flipped board.
+        rotation_offsets (dict[str, float]): Package name or glob pattern (e.g. "SOT-23",
+            "QFN-*", "LED_*") mapped to a rotation offset in degrees.
+    """
+
+    REQUIRED_HEADERS = {"Package", "Offset"}
+
+    def __init__(
+        self,
+        origin: tuple[float, float] = (0.0, 0.0),
+        mirror_width: float | None = None,
+        rotation_offsets: dict[str, float] | None = None,
+    ):
+        self.origin = origin
+        self.mirror_width = mirror_width
+        self.rotation_offsets = rotation_offsets or {}
+        self.info = ComponentInfo()
+        ox, oy = origin
+        # (a, b, tx, c, d, ty, mirrored): x' = a*x + b*y + tx, y' = c*x + d*y + ty
+        self.matrices = {"top": (1.0, 0.0, -ox, 0.0, 1.0, -oy, False)}
+        if mirror_width is None:
+            self.matrices["bottom"] = self.matrices["top"]
+        else:
+            self.matrices["bottom"] = (-1.0, 0.0, mirror_width + ox, 0.0, 1.0, -oy, True)
+        self.__compile_offsets()
+
+    @classmethod
+    def load_rotation_offsets(cls, path: Path) -> dict[str, float]:
+        """
+        Read a rotation-offset table from a csv file with "Package" and "Offset" columns.
+
+        Args:
+            path (Path): The csv file to read.
+
+        Returns:
+            dict[str, float]: Package name or pattern mapped to offset in degrees.
+        """
+        with path.open("r", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            if not cls.REQUIRED_HEADERS.issubset(set(reader.fieldnames or [])):
+                raise ValueError(
+                    f"Input file missing required headers. Required: {cls.REQUIRED_HEADERS}, found: {set(reader.fieldnames or [])}"
+                )
+            offsets = {}
+            for row in reader:
+                package = row["Package"].strip()
+                try:
+                    offsets[package] = float(row["Offset"])
+                except ValueError as e:
+                    raise ValueError(f"Invalid offset in row: {row}") from e
+            return offsets
+
+    def __compile_offsets(self):
+        # one alternation with a named group per entry, first match wins
+        self.__offsets = list(self.rotation_offsets.values())
+        self.__pattern = None
+        if self.rotation_offsets:
+            self.__pattern = re.compile(
+                "|".join(
+                    f"(?P<p{i}>{translate(pattern.upper())})"
+                    for i, pattern in enumerate(self.rotation_offsets)
+                )
+            )
+        self.__resolved = dict[str, float]()
+
+    def rotation_offset(self, package: str) -> float:
+        """
+        Get the rotation offset for a footprint, matching the package name first and
+        the full footprint name second.
+
+        Args:
+            package (str): The footprint name, e.g. "R_0603_1608Metric".
+
+        Returns:
+            float: Offset in degrees, 0 if no entry matches.
+        """
+        if package in self.__resolved:
+            return self.__resolved[package]
+        offset = 0.0
+        if self.__pattern:
+            for candidate in (self.info.get_package(package), package.upper()):
+                match = candidate and self.__pattern.match(candidate)
+                if match:
+                    offset = self.__offsets[int(match.lastgroup[1:])]
+                    break
+        self.__resolved[package] = offset
+        return offset
+
+    def apply(self, components: set[KicadComponent]):
+        """
+        Transform positions and rotations of all components in place.
+
+        Args:
+            components (set[KicadComponent]): Components with KiCad coordinates.
+        """
+        components = list(components)
+        offsets = [self.rotation_offset(c.package) for c in components]
+        matrices = [self.matrices.get(c.side, self.matrices["top"]) for c in components]
+        for c, (a, b, tx, cc, d, ty, mirrored), offset in zip(
+            components, matrices, offsets
+        ):
+            x, y = c.pos_x, c.pos_y
+            c.pos_x = round(a * x + b * y + tx, 2)
+            c.pos_y = round(cc * x + d * y + ty, 2)
+            rot = (180.0 - c.rot if mirrored else c.rot) + offset
+            # normalize to KiCad's (-180, 180] range
+            rot = (rot + 180.0) % 360.0 - 180.0
+            c.rot = 180.0 if rot == -180.0 else round(rot, 1)
@@ -8,117 +8,111 @@ class Writer:
         self,
         components: list[KicadComponent],
         output: Path,
+        header_rows: list[list[str]] | None = None,
     ):
         self.components = components
         self.output = output
+        # rows above the placement table, e.g. kept from a previous YY1 file
+        self.header_rows = header_rows
+
+    def default_header_rows(self) -> list[list[str]]:
+        return [
+            ["NEODEN", "YY1", "P&P FILE", "", "", "", "", "", "", "", ""],
+            ["", "", "", "", "", "", "", "", "", "", ""],
+            [
+                "PanelizedPCB",
+                "UnitLength",
+                "0",
+                "UnitWidth",
+                "0",
+                "Rows",
+                "1",
+                "Columns",
+                "1",
+                "",
+                "",
+                "",
+                "",
+            ],
+            ["", "", "", "", "", "", "", "", "", "", ""],
+            [
+                "Fiducial",
+                "1-X",
+                "13.09",
+                "1-Y",
+                "55.01",
+                "OverallOffsetX",
+                "0",
+                "OverallOffsetY",
+                "0",
+                "",
+                "",
+                "",
+            ],
+            ["", "", "", "", "", "", "", "", "", "", ""],
+            [
+                "NozzleChange",
+                "OFF",
+                "BeforeComponent",
+                "1",
+                "Head1",
+                "Drop",
+                "Station2",
+                "PickUp",
+                "Station1",
+                "",
+                "",
+                "",
+            ],
+            [
+                "NozzleChange",
+                "OFF",
+                "BeforeComponent",
+                "2",
+                "Head2",
+                "Drop",
+                "Station3",
+                "PickUp",
+                "Station2",
+                "",
+                "",
+                "",
+            ],
+            [
+                "NozzleChange",
+                "OFF",
+                "BeforeComponent",
+                "1",
+                "Head1",
+                "Drop",
+                "Station1",
+                "PickUp",
+                "Station1",
+                "",
+                "",
+                "",
+            ],
+            [
+                "NozzleChange",
+                "OFF",
+                "BeforeComponent",
+                "1",
+                "Head1",
+                "Drop",
+                "Station1",
+                "PickUp",
+                "Station1",
+                "",
+                "",
+                "",
+            ],
+            ["", "", "", "", "", "", "", "", "", "", ""],
+        ]
 
     def create_file(self):
         with open(self.output, "w", newline="") as outfile:
             writer = csv.writer(outfile)
-            writer.writerow(
-                ["NEODEN", "YY1", "P&P FILE", "", "", "", "", "", "", "", ""]
-            )
-            writer.writerow(["", "", "", "", "", "", "", "", "", "", ""])
-            writer.writerow(
-                [
-                    "PanelizedPCB",
-                    "UnitLength",
-                    "0",
-                    "UnitWidth",
-                    "0",
-                    "Rows",
-                    "1",
-                    "Columns",
-                    "1",
-                    "",
-                    "",
-                    "",
-                    "",
-                ]
-            )
-            writer.writerow(["", "", "", "", "", "", "", "", "", "", ""])
-            writer.writerow(
-                [
-                    "Fiducial",
-                    "1-X",
-                    "13.09",
-                    "1-Y",
-                    "55.01",
-                    "OverallOffsetX",
-                    "0",
-                    "OverallOffsetY",
-                    "0",
-                    "",
-                    "",
-                    "",
-                ]
-            )
-            writer.writerow(["", "", "", "", "", "", "", "", "", "", ""])
-            writer.writerow(
-                [
-                    "NozzleChange",
-                    "OFF",
-                    "BeforeComponent",
-                    "1",
-                    "Head1",
-                    "Drop",
-                    "Station2",
-                    "PickUp",
-                    "Station1",
-                    "",
-                    "",
-                    "",
-                ]
-            )
-            writer.writerow(
-                [
-                    "NozzleChange",
-                    "OFF",
-                    "BeforeComponent",
-                    "2",
-                    "Head2",
-                    "Drop",
-                    "Station3",
-                    "PickUp",
-                    "Station2",
-                    "",
-                    "",
-                    "",
-                ]
-            )
-            writer.writerow(
-                [
-                    "NozzleChange",
-                    "OFF",
-                    "BeforeComponent",
-                    "1",
-                    "Head1",
-                    "Drop",
-                    "Station1",
-                    "PickUp",
-                    "Station1",
-                    "",
-                    "",
-                    "",
-                ]
-            )
-            writer.writerow(
-                [
-                    "NozzleChange",
-                    "OFF",
-                    "BeforeComponent",
-                    "1",
-                    "Head1",
-                    "Drop",
-                    "Station1",
-                    "PickUp",
-                    "Station1",
-                    "",
-                    "",
-                    "",
-                ]
-            )
-            writer.writerow(["", "", "", "", "", "", "", "", "", "", ""])
+            writer.writerows(self.header_rows or self.default_header_rows())
             writer.writerow(
                 [
                     "Designator",
@@ -147,10 +141,10 @@ class Writer:
                         c.rot,
                         c.head,
                         c.feederNo,
-                        100,
-                        0,
+                        c.mount_speed,
+                        c.pick_height,
                         c.height,
-                        1,
-                        0,
+                        c.mode,
+                        c.skip,
                     ]
                 )